@@ -15,6 +15,7 @@ from .transformer import (
     replace_embeds,
     replace_page_alias_links,
     replace_wikilinks_to_dv_fields,
+    transform_file,
     transform_markdown,
     transform_tasks,
 )
@@ -41,6 +42,7 @@ __all__ = [
     "replace_embeds",
     "replace_page_alias_links",
     "replace_wikilinks_to_dv_fields",
+    "transform_file",
     "transform_markdown",
     "transform_tasks",
 ]
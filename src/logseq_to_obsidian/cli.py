@@ -1,26 +1,72 @@
 from __future__ import annotations
 
 import argparse
+import logging
 import sys
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from .planner import Options, collect_files, copy_or_write
 from .transformer import (
+    _clear_run_caches,
     build_block_index,
     replace_asset_images,
     replace_block_refs,
     replace_embeds,
     replace_page_alias_links,
     replace_wikilinks_to_dv_fields,
-    transform_markdown,
+    transform_file,
 )
 from .version import __version__
 
-__all__ = ["main", "parse_args"]
+__all__ = ["build_parser", "main", "parse_args"]
 
+_LOGGER_NAME = "logseq_to_obsidian"
 
-def parse_args(argv: List[str]) -> Options:
+
+def _stdout_handler() -> logging.Handler:
+    # Library warnings are printed as-is next to the other progress lines
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+
+@contextmanager
+def _log_to_stdout() -> Iterator[None]:
+    """Print `logseq_to_obsidian` log records on stdout for the duration of one CLI run.
+
+    Records do not propagate meanwhile, so callers with root handlers don't see them twice.
+    The handler is removed and `propagate` restored afterwards.
+    """
+    logger = logging.getLogger(_LOGGER_NAME)
+    handler = _stdout_handler()
+    propagate = logger.propagate
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        yield
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = propagate
+
+
+def _init_worker_logging() -> None:
+    """Pool initializer: print log records on the worker's stdout like the main process does.
+
+    Forked workers inherit the handler installed by `_log_to_stdout`; spawned workers start without one.
+    The setting lives only as long as the worker process.
+    """
+    logger = logging.getLogger(_LOGGER_NAME)
+    if not logger.handlers:
+        logger.addHandler(_stdout_handler())
+        logger.propagate = False
+
+
+@lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    """Return the CLI argument parser; built once and reused, since parsing does not mutate it."""
     p = argparse.ArgumentParser(description="Convert a Logseq vault to Obsidian-friendly Markdown.")
     p.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
     p.add_argument("--input", required=True, help="Path to Logseq vault root")
@@ -39,7 +85,20 @@ def parse_args(argv: List[str]) -> Options:
         help="Convert wikilinks of the form [[key/value]] to Dataview inline fields [key::value] for the given key(s).",
     )
     p.add_argument("--dry-run", action="store_true", help="Do not write files; print plan only")
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to transform markdown files (default: 1)",
+    )
+    return p
+
+
+def parse_args(argv: List[str]) -> Options:
+    p = build_parser()
     args = p.parse_args(argv)
+    if args.jobs < 1:
+        p.error("--jobs must be at least 1")
     return Options(
         input_dir=Path(args.input).resolve(),
         output_dir=Path(args.output).resolve(),
@@ -47,21 +106,87 @@ def parse_args(argv: List[str]) -> Options:
         dry_run=bool(args.dry_run),
         tasks_format=str(args.tasks_format),
         field_keys=list(args.field_key or []),
+        jobs=int(args.jobs),
     )
 
 
+# Read-only arguments shared by every work item; set once per worker by `_init_worker`
+_WORKER_SHARED: Tuple[Any, ...] = ()
+
+
+def _init_worker(shared: Tuple[Any, ...]) -> None:
+    """Pool initializer: set up logging and keep the shared arguments for `_call_with_shared`."""
+    global _WORKER_SHARED
+    _init_worker_logging()
+    _WORKER_SHARED = shared
+
+
+def _call_with_shared(func: Callable[..., Any], *item: Any) -> Any:
+    return func(*_WORKER_SHARED, *item)
+
+
+def _starmap(
+    func: Callable[..., Any],
+    items: Sequence[Tuple[Any, ...]],
+    jobs: int,
+    shared: Tuple[Any, ...] = (),
+) -> List[Any]:
+    """Return `func(*shared, *item)` for every item, in up to `jobs` worker processes; results keep the input order.
+
+    `shared` is handed to each worker once instead of being pickled with every chunk of items.
+    """
+    if jobs > 1 and len(items) > 1:
+        # Imported here so serial runs (the default) don't pay for loading multiprocessing
+        from multiprocessing import Pool
+
+        processes = min(jobs, len(items))
+        # About four chunks per worker keeps every process busy without sending items one by one
+        chunksize = max(1, len(items) // (4 * processes))
+        with Pool(processes, initializer=_init_worker, initargs=(shared,)) as pool:
+            return pool.starmap(partial(_call_with_shared, func), items, chunksize=chunksize)
+    return [func(*shared, *item) for item in items]
+
+
+def _finish_markdown(
+    block_index: Dict[str, Path],
+    in_to_out: Dict[Path, Path],
+    output_root: Path,
+    field_keys: List[str],
+    text: str,
+) -> str:
+    """Apply the link rewrites that need the vault-wide block index to one pre-transformed page."""
+    text = replace_block_refs(text, block_index, in_to_out, output_root)
+    text = replace_embeds(text)
+    text = replace_page_alias_links(text)
+    text = replace_wikilinks_to_dv_fields(text, field_keys)
+    text = replace_asset_images(text)
+    # Ensure a trailing newline at EOF to match golden outputs
+    if not text.endswith("\n"):
+        text += "\n"
+    return text
+
+
 def main(argv: List[str]) -> int:
     opt = parse_args(argv)
     if not opt.input_dir.exists():
         print(f"Input directory not found: {opt.input_dir}", file=sys.stderr)
         return 1
     opt.output_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        with _log_to_stdout():
+            return _convert(opt)
+    finally:
+        # Cached pages are only useful within one run; don't keep them in the caller's process
+        _clear_run_caches()
+
 
+def _convert(opt: Options) -> int:
+    """Run the two-pass conversion for already-validated options."""
     print("[START] Logseq → Obsidian conversion")
     print(f"[CONFIG] input={opt.input_dir}")
     print(f"[CONFIG] output={opt.output_dir}")
     print(
-        f"[CONFIG] daily_folder={opt.daily_folder or '-'} tasks_format={opt.tasks_format} field_keys={','.join(opt.field_keys) or '-'} dry_run={opt.dry_run}"
+        f"[CONFIG] daily_folder={opt.daily_folder or '-'} tasks_format={opt.tasks_format} field_keys={','.join(opt.field_keys) or '-'} dry_run={opt.dry_run} jobs={opt.jobs}"
     )
 
     warn_messages: List[str] = []
@@ -75,7 +200,8 @@ def main(argv: List[str]) -> int:
     pre_texts: Dict[Path, str] = {}
     in_to_out: Dict[Path, Path] = {pl.in_path: pl.out_path for pl in plans}
 
-    # warn_messages is shared with planner warnings
+    results: List[Tuple[Path, str, List[str]]] = []
+    work_items: List[Tuple[Path, Optional[str], Optional[Path], str]] = []
     for pl in plans:
         if not pl.is_markdown:
             continue
@@ -84,40 +210,39 @@ def main(argv: List[str]) -> int:
         except ValueError:
             rel = pl.in_path
         print(f"[TRANSFORM] {rel}")
-        raw = pl.in_path.read_text(encoding="utf-8")
         # Compute the expected title as the vault-relative output path without extension
         try:
             rel_out = pl.out_path.relative_to(opt.output_dir)
         except ValueError:
             rel_out = pl.out_path
         expected_title = rel_out.with_suffix("").as_posix()
-        transformed = transform_markdown(
-            raw,
-            expected_title_path=expected_title,
-            rel_path_for_warn=rel,
-            warn_collector=warn_messages,
-            tasks_format=opt.tasks_format,
-        )
-        pre_texts[pl.in_path] = transformed
+        item = (pl.in_path, expected_title, rel, opt.tasks_format)
+        if opt.jobs > 1:
+            work_items.append(item)
+        else:
+            # Transform right away so a file's warnings follow its progress line
+            results.append(transform_file(*item))
+
+    # Files are independent of each other here; only the block index below needs all of them
+    results.extend(_starmap(transform_file, work_items, opt.jobs))
+    # warn_messages is shared with planner warnings
+    for in_path, transformed, warnings in results:
+        pre_texts[in_path] = transformed
+        warn_messages.extend(warnings)
 
     block_index = build_block_index(pre_texts)
     print(f"[INDEX] Resolved {len(block_index)} block id(s)")
 
-    # Second pass: write files, replacing block refs using the index
+    # Second pass: rewrite links with the read-only index (in workers with --jobs), then write in plan order
+    md_plans = [pl for pl in plans if pl.is_markdown]
+    shared = (block_index, in_to_out, opt.output_dir, opt.field_keys)
+    finish_items = [(pre_texts[pl.in_path],) for pl in md_plans]
+    finished = dict(zip((pl.in_path for pl in md_plans), _starmap(_finish_markdown, finish_items, opt.jobs, shared)))
     writes = 0
     copies = 0
     for pl in plans:
         if pl.is_markdown:
-            text = pre_texts.get(pl.in_path, pl.in_path.read_text(encoding="utf-8"))
-            text = replace_block_refs(text, block_index, in_to_out, opt.output_dir)
-            text = replace_embeds(text)
-            text = replace_page_alias_links(text)
-            text = replace_wikilinks_to_dv_fields(text, opt.field_keys)
-            text = replace_asset_images(text)
-            # Ensure a trailing newline at EOF to match golden outputs
-            if not text.endswith("\n"):
-                text += "\n"
-            copy_or_write(pl.out_path, text, pl.in_path, opt.dry_run)
+            copy_or_write(pl.out_path, finished[pl.in_path], pl.in_path, opt.dry_run)
             writes += 1
         else:
             # Copy assets and others
@@ -19,6 +19,7 @@ class Options:
     dry_run: bool
     tasks_format: str  # 'emoji' or 'dataview'
     field_keys: List[str]
+    jobs: int = 1  # worker processes for transforming markdown files
 
 
 @dataclass
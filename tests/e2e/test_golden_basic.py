@@ -2,7 +2,7 @@ from pathlib import Path
 
 import pytest
 
-from tests.helpers import compare_trees, run_converter
+from tests.helpers import abspath, compare_trees, run_converter
 
 
 @pytest.mark.req("REQ-FRONTMATTER-001")
@@ -17,9 +17,9 @@ from tests.helpers import compare_trees, run_converter
 @pytest.mark.req("REQ-STRUCTURE-001")
 @pytest.mark.req("REQ-STRUCTURE-002")
 def test_golden_basic(tmp_path: Path):
-    src = Path("tests/fixtures/logseq/basic").resolve()
+    src = abspath("tests/fixtures/logseq/basic")
     out = tmp_path / "out"
-    expected = Path("tests/golden/basic").resolve()
+    expected = abspath("tests/golden/basic")
 
     code = run_converter(src, out)
     assert code == 0
@@ -44,9 +44,9 @@ def test_golden_basic(tmp_path: Path):
 @pytest.mark.req("REQ-JOURNALS-001")
 @pytest.mark.req("REQ-JOURNALS-002")
 def test_golden_with_options(tmp_path: Path):
-    src = Path("tests/fixtures/logseq/basic").resolve()
+    src = abspath("tests/fixtures/logseq/basic")
     out = tmp_path / "out"
-    expected = Path("tests/golden/basic_opts").resolve()
+    expected = abspath("tests/golden/basic_opts")
 
     code = run_converter(
         src,
@@ -58,3 +58,34 @@ def test_golden_with_options(tmp_path: Path):
 
     ok, msg = compare_trees(out, expected)
     assert ok, msg
+
+
+@pytest.mark.req("REQ-CLI-002")
+def test_golden_basic_with_parallel_jobs(tmp_path: Path):
+    src = abspath("tests/fixtures/logseq/basic")
+    out = tmp_path / "out"
+    expected = abspath("tests/golden/basic")
+
+    # Four pages on two workers are sent one per chunk, so results are reassembled from several chunks
+    code = run_converter(src, out, "--jobs", "2")
+    assert code == 0
+
+    ok, msg = compare_trees(out, expected)
+    assert ok, msg
+
+
+@pytest.mark.req("REQ-STRUCTURE-001")
+def test_golden_compare_reports_extra_namespace_folder(tmp_path: Path):
+    # Namespaced pages become folders such as `tags/`, which must not be skipped by the tree comparison
+    src = abspath("tests/fixtures/logseq/basic")
+    out = tmp_path / "out"
+    expected = abspath("tests/golden/basic")
+
+    code = run_converter(src, out)
+    assert code == 0
+    (out / "tags").mkdir()
+    (out / "tags" / "foo.md").write_text("extra\n", encoding="utf-8")
+
+    ok, msg = compare_trees(out, expected)
+    assert not ok
+    assert "tags" in msg
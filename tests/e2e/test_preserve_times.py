@@ -1,17 +1,18 @@
+import os
 from pathlib import Path
 
 import pytest
 
-from tests.helpers import run_converter
+from tests.helpers import abspath, run_converter
 
 
 def _mtime_s(p: Path) -> int:
-    return int(p.stat().st_mtime)
+    return os.stat(p).st_mtime_ns // 1_000_000_000
 
 
 @pytest.mark.req("REQ-MTIME-001")
 def test_preserve_times_for_markdown_and_assets(tmp_path: Path):
-    src = Path("tests/fixtures/logseq/basic").resolve()
+    src = abspath("tests/fixtures/logseq/basic")
     out = tmp_path / "out"
     code = run_converter(src, out)
     assert code == 0
@@ -2,51 +2,71 @@ from __future__ import annotations
 
 import filecmp
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import List, Optional, Tuple, Union
 
-import logseq_to_obsidian as l2o
+_CWD = os.getcwd()
 
 
-def run_converter(input_dir: Path, output_dir: Path, *args: str) -> int:
-    argv = [
-        "--input",
-        str(input_dir),
-        "--output",
-        str(output_dir),
-        *args,
-    ]
-    return l2o.main(argv)
+def abspath(p: Union[str, Path]) -> Path:
+    """Absolute path relative to the working directory, without resolve()'s per-component symlink lookups."""
+    return Path(os.path.normpath(os.path.join(_CWD, p)))
 
 
-def _iter_files(root: Path) -> Iterable[Path]:
-    for dirpath, _, filenames in os.walk(root):
-        for name in filenames:
-            # Ignore test metadata files that are not part of the golden output
-            if name == "manifest.yml":
-                continue
-            p = Path(dirpath) / name
-            yield p.relative_to(root)
+def run_converter(input_dir: Union[str, Path], output_dir: Union[str, Path], *args: str) -> int:
+    # Imported on first use so modules that only need the tree helpers do not load the converter
+    from logseq_to_obsidian import main
+
+    argv = ["--input", os.fspath(input_dir), "--output", os.fspath(output_dir), *args]
+    return main(argv)
+
+
+def _describe_mismatch(rel: str, a: Path, e: Path) -> Optional[str]:
+    """Return a message for a file pair whose bytes differ, or None if they still match as text."""
+    if a.suffix.lower() in {".md", ".txt"}:
+        # Text files still match if they only differ in line endings
+        a_text = a.read_text(encoding="utf-8")
+        e_text = e.read_text(encoding="utf-8")
+        if a_text != e_text:
+            return f"Content mismatch for {rel}:\n--- actual ---\n{a_text}\n--- expected ---\n{e_text}"
+        return None
+    return f"Binary mismatch for {rel}"
 
 
 def compare_trees(actual: Path, expected: Path) -> Tuple[bool, str]:
-    actual_set = set(_iter_files(actual))
-    expected_set = set(_iter_files(expected))
-    if actual_set != expected_set:
-        only_actual = sorted(str(p) for p in (actual_set - expected_set))
-        only_expected = sorted(str(p) for p in (expected_set - actual_set))
-        return False, f"Tree mismatch. Only in actual: {only_actual}; Only in expected: {only_expected}"
-
-    for rel in sorted(actual_set):
-        a = actual / rel
-        e = expected / rel
-        if a.suffix.lower() in {".md", ".txt"}:
-            a_text = a.read_text(encoding="utf-8")
-            e_text = e.read_text(encoding="utf-8")
-            if a_text != e_text:
-                return False, f"Content mismatch for {rel}:\n--- actual ---\n{a_text}\n--- expected ---\n{e_text}"
-        else:
-            # Binary/other: compare by bytes
-            if not filecmp.cmp(a, e, shallow=False):
-                return False, f"Binary mismatch for {rel}"
+    only_actual: List[str] = []
+    only_expected: List[str] = []
+    # (root-relative prefix, actual dir, expected dir, names of files present in both)
+    common: List[Tuple[str, str, str, List[str]]] = []
+
+    def walk(dc: filecmp.dircmp, prefix: str) -> None:
+        # A name that is a file on one side and a directory on the other counts as missing on both
+        only_actual.extend(prefix + name for name in dc.left_only + dc.common_funny)
+        only_expected.extend(prefix + name for name in dc.right_only + dc.common_funny)
+        common.append((prefix, dc.left, dc.right, dc.common_files))
+        for name, sub in dc.subdirs.items():
+            walk(sub, f"{prefix}{name}/")
+
+    # Ignore test metadata files that are not part of the golden output
+    walk(filecmp.dircmp(actual, expected, ignore=["manifest.yml"]), "")
+    if only_actual or only_expected:
+        return False, f"Tree mismatch. Only in actual: {sorted(only_actual)}; Only in expected: {sorted(only_expected)}"
+
+    def cmp_dir(prefix: str, actual_dir: str, expected_dir: str, names: List[str]) -> Tuple[List[str], List[str]]:
+        # Byte compare a whole directory at once; returns (names that differ, names that could not be compared)
+        _, mismatch, errors = filecmp.cmpfiles(actual_dir, expected_dir, names, shallow=False)
+        return [prefix + name for name in mismatch], [prefix + name for name in errors]
+
+    # File reads release the GIL, so directories are compared concurrently
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+        results = list(ex.map(cmp_dir, *zip(*common)))
+    errors = sorted(rel for _, errs in results for rel in errs)
+    if errors:
+        return False, f"Could not compare (unreadable or not a regular file on both sides): {errors}"
+    differing = sorted(rel for mismatch, _ in results for rel in mismatch)
+    for rel in differing:
+        msg = _describe_mismatch(rel, actual / rel, expected / rel)
+        if msg is not None:
+            return False, msg
     return True, ""
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Iterator, List, Set
 
 import pytest
 import yaml
 
 SPEC_PATH = Path("docs/spec/requirements.yml")
+GOLDEN_ROOT = "tests/golden"
+# Probed once at import; neither location changes during a test session
+_SPEC_EXISTS = SPEC_PATH.exists()
+_GOLDEN_EXISTS = os.path.isdir(GOLDEN_ROOT)
+# libyaml-backed loader when available; same results as SafeLoader, much faster
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def _load_requirement_sets() -> tuple[Set[str], Set[str]]:
@@ -15,9 +22,9 @@ def _load_requirement_sets() -> tuple[Set[str], Set[str]]:
     - all_ids: every requirement id present in the spec
     - active_ids: only ids with status: active (enforced coverage)
     """
-    if not SPEC_PATH.exists():
+    if not _SPEC_EXISTS:
         return set(), set()
-    data = yaml.safe_load(SPEC_PATH.read_text(encoding="utf-8")) or []
+    data = yaml.load(SPEC_PATH.read_bytes(), Loader=YAML_LOADER) or []
     all_ids: Set[str] = set()
     active_ids: Set[str] = set()
     for entry in data:
@@ -33,13 +40,24 @@ def _load_requirement_sets() -> tuple[Set[str], Set[str]]:
     return all_ids, active_ids
 
 
-def _load_manifest_ids() -> Dict[Path, Set[str]]:
-    ids_by_manifest: Dict[Path, Set[str]] = {}
-    for p in Path("tests/golden").rglob("manifest.yml"):
-        data = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
-        reqs = data.get("requirements") or []
-        ids_by_manifest[p] = {r for r in reqs if isinstance(r, str)}
-    return ids_by_manifest
+def _iter_manifest_files(root: str = GOLDEN_ROOT) -> Iterator[str]:
+    """Yield the path of every `manifest.yml` below `root`."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                yield from _iter_manifest_files(entry.path)
+            elif entry.name == "manifest.yml" and entry.is_file():
+                yield entry.path
+
+
+def _iter_manifest_ids() -> Iterator[str]:
+    """Yield the requirement ids listed in every golden `manifest.yml`."""
+    if not _GOLDEN_EXISTS:
+        return
+    for path in _iter_manifest_files():
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=YAML_LOADER) or {}
+        yield from (r for r in (data.get("requirements") or []) if isinstance(r, str))
 
 
 def pytest_configure(config: pytest.Config) -> None:
@@ -57,22 +75,35 @@ def pytest_collection_modifyitems(session: pytest.Session, config: pytest.Config
     tests_without: List[str] = getattr(config, "_req_tests_without", [])
 
     for item in items:
-        req_ids: List[str] = []
-        for m in item.iter_markers(name="req"):
-            for arg in m.args:
-                if isinstance(arg, str):
-                    req_ids.append(arg)
-        if not req_ids:
+        req_ids = [arg for m in item.iter_markers(name="req") for arg in m.args if isinstance(arg, str)]
+        if req_ids:
+            used_ids.update(req_ids)
+        else:
             tests_without.append(item.nodeid)
-        used_ids.update(req_ids)
 
     # Also treat golden manifests as coverage
-    for ids in _load_manifest_ids().values():
-        used_ids.update(ids)
+    used_ids.update(_iter_manifest_ids())
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    """Merge the ids a pytest-xdist worker collected into the controller's sets."""
+    output = getattr(node, "workeroutput", {})
+    config = node.config
+    config._req_used_ids.update(output.get("req_used_ids", ()))  # type: ignore[attr-defined]
+    tests_without: List[str] = config._req_tests_without  # type: ignore[attr-defined]
+    # Every worker collects the full test set, so keep each node id once
+    tests_without[:] = dict.fromkeys(tests_without + list(output.get("req_tests_without", ())))
 
 
 def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
     config = session.config
+    workeroutput = getattr(config, "workeroutput", None)
+    if workeroutput is not None:
+        # pytest-xdist worker: hand the collected ids to the controller, which reports
+        workeroutput["req_used_ids"] = sorted(getattr(config, "_req_used_ids", set()))
+        workeroutput["req_tests_without"] = list(getattr(config, "_req_tests_without", []))
+        return
     all_ids: Set[str] = getattr(config, "_req_all_ids", set())
     active_ids: Set[str] = getattr(config, "_req_active_ids", set())
     used_ids: Set[str] = getattr(config, "_req_used_ids", set())
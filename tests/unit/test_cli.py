@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import logging
+import sys
+
 import pytest
 
-from logseq_to_obsidian import __version__, parse_args
+from logseq_to_obsidian import __version__, main, parse_args
+from logseq_to_obsidian.cli import _starmap
 
 
 @pytest.mark.req("REQ-CLI-001")
@@ -13,3 +17,47 @@ def test_version_flag_reports_package_version(capsys):
     assert excinfo.value.code == 0
     out = capsys.readouterr().out.strip()
     assert __version__ in out
+
+
+@pytest.mark.req("REQ-TITLE-001")
+def test_main_prints_title_warning_once_and_restores_logger(tmp_path, capsys):
+    pages = tmp_path / "in" / "pages"
+    pages.mkdir(parents=True)
+    (pages / "note.md").write_text("title:: Other\n\n- body\n", encoding="utf-8")
+    logger = logging.getLogger("logseq_to_obsidian")
+    handlers = list(logger.handlers)
+    # A root handler must not print the warning a second time
+    root_handler = logging.StreamHandler(sys.stdout)
+    logging.getLogger().addHandler(root_handler)
+    try:
+        assert main(["--input", str(tmp_path / "in"), "--output", str(tmp_path / "out")]) == 0
+    finally:
+        logging.getLogger().removeHandler(root_handler)
+
+    assert capsys.readouterr().out.count("Title property mismatch") == 1
+    assert logger.handlers == handlers
+    assert logger.propagate
+
+
+@pytest.mark.req("REQ-TITLE-001")
+def test_main_prints_title_warning_after_its_transform_line(tmp_path, capsys):
+    pages = tmp_path / "in" / "pages"
+    pages.mkdir(parents=True)
+    (pages / "a.md").write_text("title:: Other\n\n- body\n", encoding="utf-8")
+    (pages / "b.md").write_text("title:: Other\n\n- body\n", encoding="utf-8")
+
+    assert main(["--input", str(tmp_path / "in"), "--output", str(tmp_path / "out")]) == 0
+
+    lines = [line for line in capsys.readouterr().out.splitlines() if "[TRANSFORM]" in line or "mismatch" in line]
+    assert len(lines) == 4
+    for transform, warning in zip(lines[::2], lines[1::2]):
+        name = transform.split("/")[-1]
+        assert "Title property mismatch" in warning and name in warning
+
+
+@pytest.mark.req("REQ-CLI-002")
+def test_starmap_keeps_input_order_across_worker_chunks():
+    items = [(i, 2) for i in range(40)]
+
+    assert _starmap(pow, items, 3) == [i**2 for i in range(40)]
+    assert _starmap(pow, [(2,), (3,)], 2, shared=(10,)) == [100, 1000]
@@ -1,8 +1,22 @@
+import logging
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
-import logseq_to_obsidian as l2o
+from logseq_to_obsidian import (
+    attach_block_ids,
+    emit_yaml_frontmatter,
+    normalize_tags,
+    parse_page_properties,
+    replace_asset_images,
+    replace_block_refs,
+    replace_embeds,
+    replace_page_alias_links,
+    replace_wikilinks_to_dv_fields,
+    transform_markdown,
+    transform_tasks,
+)
 
 
 @pytest.mark.req("REQ-FRONTMATTER-001")
@@ -16,13 +30,16 @@ def test_parse_page_properties_basic():
         "\n",
         "Body starts here\n",
     ]
-    props, consumed = l2o.parse_page_properties(lines)
+    props, consumed = parse_page_properties(lines)
     assert consumed == 3
     assert props["title"] == "My Note"
     assert props["tags"].startswith("a")
     assert props["aliases"].startswith("[[Alt]]")
 
 
+_EXPECTED_YAML = "---\ntitle: Foo\naliases:\n  - A\n  - B\ntags:\n  - x\n  - y\n  - z\ncustom: value\n---\n\n"
+
+
 @pytest.mark.req("REQ-FRONTMATTER-001")
 @pytest.mark.req("REQ-FRONTMATTER-002")
 @pytest.mark.req("REQ-FRONTMATTER-003")
@@ -34,98 +51,115 @@ def test_emit_yaml_frontmatter_mapping():
         "aliases": "[[A]], B",
         "custom": "value",
     }
-    yaml = l2o.emit_yaml_frontmatter(props)
-    assert yaml is not None
-    assert "title: Foo" in yaml
-    assert "aliases:\n  - A\n  - B" in yaml
-    assert "tags:\n  - x\n  - y\n  - z" in yaml
-    assert "custom: value" in yaml
+    yaml = emit_yaml_frontmatter(props)
+    # Full comparison also pins the key order: title, aliases, tags, then the rest
+    assert yaml == _EXPECTED_YAML
 
 
 @pytest.mark.req("REQ-FRONTMATTER-003")
 def test_normalize_tags_handles_unicode_characters():
-    tags = l2o.normalize_tags("#가나다, #마바사")
+    tags = normalize_tags("#가나다, #마바사")
     assert tags == ["가나다", "마바사"]
 
 
 @pytest.mark.req("REQ-FRONTMATTER-003")
 def test_emit_yaml_frontmatter_handles_underscored_unicode_tags():
-    yaml = l2o.emit_yaml_frontmatter({"tags": "#_가나다, #_마바사"})
+    yaml = emit_yaml_frontmatter({"tags": "#_가나다, #_마바사"})
     expected = "---\ntags:\n  - _가나다\n  - _마바사\n---\n\n"
     assert yaml == expected
 
 
 @pytest.mark.req("REQ-FRONTMATTER-003")
 def test_normalize_tags_ignores_embedded_property_tokens():
-    tags = l2o.normalize_tags("tags:: #_가나다, #_마바사")
+    tags = normalize_tags("tags:: #_가나다, #_마바사")
     assert tags == ["_가나다", "_마바사"]
 
 
+_STATE_CASES = [
+    # Unchecked states
+    ("- TODO Work\n", "- [ ] Work\n"),
+    ("- DOING Work\n", "- [ ] Work\n"),
+    ("- LATER Soon\n", "- [ ] Soon\n"),
+    ("- NOW Now\n", "- [ ] Now\n"),
+    ("- WAIT Hold\n", "- [ ] Hold\n"),
+    ("- WAITING Hold\n", "- [ ] Hold\n"),
+    ("- IN-PROGRESS Going\n", "- [ ] Going\n"),
+    # Checked states
+    ("- DONE Done\n", "- [x] Done\n"),
+    ("- CANCELED Skip\n", "- [x] Skip\n"),
+    ("- CANCELLED Skip\n", "- [x] Skip\n"),
+]
+
+
 @pytest.mark.req("REQ-TASKS-001")
 @pytest.mark.req("REQ-TASKS-002")
 @pytest.mark.req("REQ-TASKS-004")
 @pytest.mark.req("REQ-TASKS-005")
 @pytest.mark.req("REQ-TASKS-006")
-def test_transform_tasks_all_states_simple_mapping():
-    # Unchecked states
-    assert l2o.transform_tasks("- TODO Work\n") == "- [ ] Work\n"
-    assert l2o.transform_tasks("- DOING Work\n") == "- [ ] Work\n"
-    assert l2o.transform_tasks("- LATER Soon\n") == "- [ ] Soon\n"
-    assert l2o.transform_tasks("- NOW Now\n") == "- [ ] Now\n"
-    assert l2o.transform_tasks("- WAIT Hold\n") == "- [ ] Hold\n"
-    assert l2o.transform_tasks("- WAITING Hold\n") == "- [ ] Hold\n"
-    assert l2o.transform_tasks("- IN-PROGRESS Going\n") == "- [ ] Going\n"
-    # Checked states
-    assert l2o.transform_tasks("- DONE Done\n") == "- [x] Done\n"
-    assert l2o.transform_tasks("- CANCELED Skip\n") == "- [x] Skip\n"
-    assert l2o.transform_tasks("- CANCELLED Skip\n") == "- [x] Skip\n"
+@pytest.mark.parametrize("src,expected", _STATE_CASES)
+def test_transform_tasks_all_states_simple_mapping(src, expected):
+    assert transform_tasks(src) == expected
+
+
+_PRIORITY_EMOJI_CASES = [
+    ("- TODO [#A] Alpha\n", "- [ ] Alpha ⏫\n"),
+    ("- DOING [#B] Beta\n", "- [ ] Beta 🔼\n"),
+    ("- DONE [#C] Gamma\n", "- [x] Gamma 🔽\n"),
+    # No priority yields no emoji
+    ("- LATER Delta\n", "- [ ] Delta\n"),
+]
 
 
 @pytest.mark.req("REQ-TASKS-PRIO-001")
 @pytest.mark.req("REQ-TASKS-PRIO-002")
-def test_priority_mapping_emoji():
-    assert l2o.transform_tasks("- TODO [#A] Alpha\n", tasks_format="emoji") == "- [ ] Alpha ⏫\n"
-    assert l2o.transform_tasks("- DOING [#B] Beta\n", tasks_format="emoji") == "- [ ] Beta 🔼\n"
-    assert l2o.transform_tasks("- DONE [#C] Gamma\n", tasks_format="emoji") == "- [x] Gamma 🔽\n"
-    # No priority yields no emoji
-    assert l2o.transform_tasks("- LATER Delta\n", tasks_format="emoji") == "- [ ] Delta\n"
+@pytest.mark.parametrize("src,expected", _PRIORITY_EMOJI_CASES)
+def test_priority_mapping_emoji(src, expected):
+    assert transform_tasks(src, tasks_format="emoji") == expected
+
+
+_PRIORITY_DATAVIEW_CASES = [
+    ("- TODO [#A] Alpha\n", "- [ ] Alpha [priority::high]\n"),
+    ("- DOING [#B] Beta\n", "- [ ] Beta [priority::medium]\n"),
+    ("- DONE [#C] Gamma\n", "- [x] Gamma [priority::low]\n"),
+    # No priority means no field emitted
+    ("- LATER Delta\n", "- [ ] Delta\n"),
+]
 
 
 @pytest.mark.req("REQ-TASKS-PRIO-001")
 @pytest.mark.req("REQ-TASKS-PRIO-003")
-def test_priority_mapping_dataview():
-    assert l2o.transform_tasks("- TODO [#A] Alpha\n", tasks_format="dataview") == "- [ ] Alpha [priority::high]\n"
-    assert l2o.transform_tasks("- DOING [#B] Beta\n", tasks_format="dataview") == "- [ ] Beta [priority::medium]\n"
-    assert l2o.transform_tasks("- DONE [#C] Gamma\n", tasks_format="dataview") == "- [x] Gamma [priority::low]\n"
-    # No priority means no field emitted
-    assert l2o.transform_tasks("- LATER Delta\n", tasks_format="dataview") == "- [ ] Delta\n"
+@pytest.mark.parametrize("src,expected", _PRIORITY_DATAVIEW_CASES)
+def test_priority_mapping_dataview(src, expected):
+    assert transform_tasks(src, tasks_format="dataview") == expected
+
+
+_SRC_PRIO_WITH_ID = "- TODO [#A] Important task\nid:: prio123\n"
 
 
 @pytest.mark.req("REQ-TASKS-PRIO-001")
 @pytest.mark.req("REQ-TASKS-PRIO-002")
 def test_priority_precedes_attached_block_anchor():
-    src = "- TODO [#A] Important task\nid:: prio123\n"
-    out = l2o.transform_markdown(src, tasks_format="emoji")
-    lines = out.splitlines()
-    assert lines[0].endswith("⏫ ^prio123")
+    out = transform_markdown(_SRC_PRIO_WITH_ID, tasks_format="emoji")
+    first, _, _ = out.partition("\n")
+    assert first.endswith("⏫ ^prio123")
 
 
 @pytest.mark.req("REQ-TASKS-PRIO-004")
 def test_priority_only_recognized_when_after_state():
     # Priority appears later in the text, not directly after state → ignored
     src1 = "- TODO Do this [#A]\n"
-    out1 = l2o.transform_tasks(src1, tasks_format="emoji")
+    out1 = transform_tasks(src1, tasks_format="emoji")
     assert out1 == "- [ ] Do this [#A]\n"
 
     # Same for dataview format: no [priority::...] emitted
-    out2 = l2o.transform_tasks(src1, tasks_format="dataview")
+    out2 = transform_tasks(src1, tasks_format="dataview")
     assert out2 == "- [ ] Do this [#A]\n"
 
 
 @pytest.mark.req("REQ-PROPS-002")
 def test_collapsed_on_head_is_filtered_and_content_kept():
     src = "- collapsed:: true\n  Real content\n"
-    out = l2o.transform_markdown(src)
+    out = transform_markdown(src)
     # Head property filtered; bullet synthesized from content
     assert out == "- Real content\n"
 
@@ -133,17 +167,17 @@ def test_collapsed_on_head_is_filtered_and_content_kept():
 @pytest.mark.req("REQ-BLOCKID-003")
 def test_id_on_head_attaches_to_first_content():
     src = "- id:: xyz789\n  First content line\n  Another\n"
-    out = l2o.transform_markdown(src)
-    lines = out.splitlines()
-    assert lines[0].endswith("^xyz789")
-    assert lines[0].startswith("- First content line")
+    out = transform_markdown(src)
+    first, _, _ = out.partition("\n")
+    assert first.endswith("^xyz789")
+    assert first.startswith("- First content line")
 
 
 @pytest.mark.req("REQ-TASKS-DATE-001")
 @pytest.mark.req("REQ-TASKS-DATE-003")
 def test_scheduled_with_time_and_repeat_emoji():
     src = "- TODO SCHEDULED: <2024-09-10 Tue 07:00 .+1d>\n"
-    out = l2o.transform_tasks(src, tasks_format="emoji")
+    out = transform_tasks(src, tasks_format="emoji")
     assert out.strip() == "- [ ] ⏳ 2024-09-10 07:00 🔁 every 1 day when done"
 
 
@@ -151,7 +185,7 @@ def test_scheduled_with_time_and_repeat_emoji():
 @pytest.mark.req("REQ-TASKS-DATE-003")
 def test_deadline_without_time_repeat_dataview():
     src = "- TODO DEADLINE: <2024-09-15 ++2w>\n"
-    out = l2o.transform_tasks(src, tasks_format="dataview")
+    out = transform_tasks(src, tasks_format="dataview")
     assert out.strip() == "- [ ] [due::2024-09-15] [repeat::every 2 weeks when done]"
 
 
@@ -160,35 +194,35 @@ def test_deadline_without_time_repeat_dataview():
 @pytest.mark.req("REQ-TASKS-DATE-002")
 def test_transform_tasks_matches_transform_markdown():
     src = "- TODO Do thing SCHEDULED: <2025-01-01> DEADLINE: <2025-01-05>\n"
-    emoji_line = l2o.transform_tasks(src, tasks_format="emoji")
-    dataview_line = l2o.transform_tasks(src, tasks_format="dataview")
-    assert emoji_line == l2o.transform_markdown(src, tasks_format="emoji")
-    assert dataview_line == l2o.transform_markdown(src, tasks_format="dataview")
+    emoji_line = transform_tasks(src, tasks_format="emoji")
+    dataview_line = transform_tasks(src, tasks_format="dataview")
+    assert emoji_line == transform_markdown(src, tasks_format="emoji")
+    assert dataview_line == transform_markdown(src, tasks_format="dataview")
 
 
 @pytest.mark.req("REQ-TASKS-DATE-004")
 @pytest.mark.req("REQ-TASKS-DATE-005")
 def test_dates_removed_and_appended_before_anchor():
     src = "- TODO [#A] Title SCHEDULED: <2024-09-20 Fri +1m>\nid:: aid123\n"
-    out = l2o.transform_markdown(src, tasks_format="emoji")
-    lines = out.splitlines()
+    out = transform_markdown(src, tasks_format="emoji")
+    first, _, _ = out.partition("\n")
     # Expect: checkbox, title, priority, scheduled, repeat, then anchor
-    assert lines[0].startswith("- [ ] Title ⏫ ⏳ 2024-09-20")
-    assert "🔁 every 1 month" in lines[0]
-    assert lines[0].endswith("^aid123")
+    assert first.startswith("- [ ] Title ⏫ ⏳ 2024-09-20")
+    assert "🔁 every 1 month" in first
+    assert first.endswith("^aid123")
 
 
 @pytest.mark.req("REQ-TASKS-DATE-006")
 def test_both_scheduled_and_deadline_emitted():
     src = "- TODO SCHEDULED: <2024-09-10> and also DEADLINE: <2024-09-15>\n"
-    out = l2o.transform_tasks(src, tasks_format="emoji")
+    out = transform_tasks(src, tasks_format="emoji")
     assert out.strip().endswith("⏳ 2024-09-10 📅 2024-09-15")
 
 
 @pytest.mark.req("REQ-TASKS-DATE-007")
 def test_scheduled_on_following_line_same_indent():
     src = "- TODO Do stuff\n  SCHEDULED: <2024-12-23 Mon>\n"
-    out = l2o.transform_markdown(src, tasks_format="emoji")
+    out = transform_markdown(src, tasks_format="emoji")
     lines = out.splitlines()
     assert lines[0] == "- [ ] Do stuff ⏳ 2024-12-23"
     # The continuation line only included the date; it should be removed entirely
@@ -199,141 +233,169 @@ def test_scheduled_on_following_line_same_indent():
 @pytest.mark.req("REQ-TASKS-001")
 def test_task_recognized_at_nested_indentation():
     src = "  \t  - TODO Nested\n"  # mix of spaces and tab before '-'
-    out = l2o.transform_markdown(src)
+    out = transform_markdown(src)
     assert out == "  \t  - [ ] Nested\n"
 
 
 @pytest.mark.req("REQ-TASKS-DATE-007")
 def test_deeper_indent_is_not_continuation():
     src = "  - TODO Parent\n  SCHEDULED: <2024-01-02>\n    - Child bullet\n"
-    out = l2o.transform_markdown(src, tasks_format="emoji")
+    out = transform_markdown(src, tasks_format="emoji")
     lines = out.splitlines()
     assert lines[0] == "  - [ ] Parent ⏳ 2024-01-02"
     # Child bullet remains as is on its own line
     assert lines[1] == "    - Child bullet"
 
 
+_SRC_NESTED_TASK = (
+    "- ## [[2025-05-25]]\n"
+    "    - Indentation level 1\n"
+    "        - Indentation level 2\n"
+    "        - DONE My task\n"
+    "          SCHEDULED: <2025-05-27 Tue>\n"
+)
+
+
+@pytest.fixture(scope="module")
+def nested_task_lines():
+    return transform_markdown(_SRC_NESTED_TASK, tasks_format="emoji").splitlines()
+
+
 @pytest.mark.req("REQ-TASKS-006")
 @pytest.mark.req("REQ-TASKS-DATE-001")
-def test_nested_task_under_heading_with_scheduled_on_its_own_line():
-    src = (
-        "- ## [[2025-05-25]]\n"
-        "    - Indentation level 1\n"
-        "        - Indentation level 2\n"
-        "        - DONE My task\n"
-        "          SCHEDULED: <2025-05-27 Tue>\n"
-    )
-    out = l2o.transform_markdown(src, tasks_format="emoji")
-    lines = out.splitlines()
-    assert lines[0] == "- ## [[2025-05-25]]"
+def test_nested_task_heading_is_kept(nested_task_lines):
+    assert nested_task_lines[0] == "- ## [[2025-05-25]]"
+
+
+@pytest.mark.req("REQ-TASKS-006")
+@pytest.mark.req("REQ-TASKS-DATE-001")
+def test_nested_task_under_heading_with_scheduled_on_its_own_line(nested_task_lines):
     # The scheduled date must be attached to the DONE task, not the parent
-    assert any(line.strip() == "- [x] My task ⏳ 2025-05-27" for line in lines)
+    assert any(line.strip() == "- [x] My task ⏳ 2025-05-27" for line in nested_task_lines)
 
 
 @pytest.mark.req("REQ-HEADCHILD-001")
 @pytest.mark.req("REQ-PROPS-001")
 def test_heading_followed_by_collapsed_then_indented_list_becomes_list_heading():
     src = "## Tag 1\ncollapsed:: true\n    - Indentation\n"
-    out = l2o.transform_markdown(src, tasks_format="emoji")
+    out = transform_markdown(src, tasks_format="emoji")
     lines = out.splitlines()
     assert lines[0].startswith("- ## Tag 1")
     assert lines[1] == "    - Indentation"
 
 
-@pytest.mark.req("REQ-LINKNS-001")
-@pytest.mark.req("REQ-LINKNS-002")
-@pytest.mark.req("REQ-LINKNS-003")
-def test_wikilink_to_dataview_field_conversion():
+_NAMESPACES = ("a",)
+_WL_CASES = [
     # No config → unchanged
-    assert l2o.replace_wikilinks_to_dv_fields("X [[a/b]] Y\n", []) == "X [[a/b]] Y\n"
+    ("X [[a/b]] Y\n", (), "X [[a/b]] Y\n"),
     # Single key
-    assert l2o.replace_wikilinks_to_dv_fields("X [[a/b]] Y\n", ["a"]) == "X [a::b] Y\n"
+    ("X [[a/b]] Y\n", _NAMESPACES, "X [a::b] Y\n"),
     # Nested value remains
-    assert l2o.replace_wikilinks_to_dv_fields("[[a/b/c]]\n", ["a"]) == "[a::b/c]\n"
+    ("[[a/b/c]]\n", _NAMESPACES, "[a::b/c]\n"),
     # Embed not converted
-    assert l2o.replace_wikilinks_to_dv_fields("![[a/b]]\n", ["a"]) == "![[a/b]]\n"
+    ("![[a/b]]\n", _NAMESPACES, "![[a/b]]\n"),
     # Aliased link not converted
-    assert l2o.replace_wikilinks_to_dv_fields("[[a/b|Alias]]\n", ["a"]) == "[[a/b|Alias]]\n"
+    ("[[a/b|Alias]]\n", _NAMESPACES, "[[a/b|Alias]]\n"),
     # Inside fenced code not converted
-    src = "```\n[[a/b]]\n```\n"
-    assert l2o.replace_wikilinks_to_dv_fields(src, ["a"]) == src
+    ("```\n[[a/b]]\n```\n", _NAMESPACES, "```\n[[a/b]]\n```\n"),
+]
+
+
+@pytest.mark.req("REQ-LINKNS-001")
+@pytest.mark.req("REQ-LINKNS-002")
+@pytest.mark.req("REQ-LINKNS-003")
+@pytest.mark.parametrize("src,ns,expected", _WL_CASES)
+def test_wikilink_to_dataview_field_conversion(src, ns, expected):
+    assert replace_wikilinks_to_dv_fields(src, ns) == expected
 
 
 @pytest.mark.req("REQ-LINKNS-001")
 @pytest.mark.req("REQ-LINKNS-003")
 def test_wikilink_after_codeblock_is_converted():
     src = "- ```\n  [[a/b]]\n  ```\n- [[a/c]]\n"
-    out = l2o.replace_wikilinks_to_dv_fields(src, ["a"])
+    out = replace_wikilinks_to_dv_fields(src, _NAMESPACES)
     assert out.endswith("[a::c]\n")
 
 
+_ATTACH_IDS_LINES = (
+    "Some text\n",
+    "id:: abc123\n",
+    "source:: url\n",
+    "id:: def456\n",
+    "\n",
+    "Another line\n",
+    "id:: ghi789\n",
+)
+
+
+@pytest.fixture(scope="module")
+def attached_ids_out():
+    # attach_block_ids only iterates its input, so the shared tuple can be passed as-is
+    return attach_block_ids(_ATTACH_IDS_LINES)
+
+
 @pytest.mark.req("REQ-BLOCKID-001")
 @pytest.mark.req("REQ-BLOCKID-002")
-def test_attach_block_ids_attaches_to_previous_content():
-    lines = [
-        "Some text\n",
-        "id:: abc123\n",
-        "source:: url\n",
-        "id:: def456\n",
-        "\n",
-        "Another line\n",
-        "id:: ghi789\n",
-    ]
-    out = l2o.attach_block_ids(lines)
-    assert "Some text ^abc123\n" in out[0]
-    # id after a property line should not attach
-    assert "id:: def456\n" in out[2]
-    # attaches to 'Another line'
-    assert out[-2].startswith("Another line") and out[-2].rstrip("\n").endswith("^ghi789")
+@pytest.mark.parametrize(
+    "index,expected",
+    [
+        (0, "Some text ^abc123\n"),
+        # id after a property line should not attach
+        (2, "id:: def456\n"),
+        # attaches to 'Another line'
+        (-2, "Another line ^ghi789\n"),
+    ],
+)
+def test_attach_block_ids_attaches_to_previous_content(attached_ids_out, index, expected):
+    assert attached_ids_out[index] == expected
+
+
+@pytest.fixture(scope="session")
+def block_ref_env(tmp_path_factory):
+    # replace_block_refs only reads the mappings; nothing is written below root
+    root = tmp_path_factory.mktemp("vault")
+    src = root / "pages/Foo.md"
+    dst = root / "Foo.md"  # flattened
+    return SimpleNamespace(root=root, src=src, dst=dst, index={"abc123": src}, in_to_out={src: dst})
 
 
 @pytest.mark.req("REQ-BLOCKREF-001")
 @pytest.mark.req("REQ-LINKPATH-001")
 @pytest.mark.req("REQ-STRUCTURE-001")
-def test_replace_block_refs_builds_vault_relative_links(tmp_path):
+def test_replace_block_refs_builds_vault_relative_links(block_ref_env):
     text = "See ((abc123))\n"
-    src = Path(tmp_path / "pages/Foo.md")
-    dst = Path(tmp_path / "Foo.md")  # flattened
-    index = {"abc123": src}
-    in_to_out = {src: dst}
-    out = l2o.replace_block_refs(text, index, in_to_out, tmp_path)
+    out = replace_block_refs(text, block_ref_env.index, block_ref_env.in_to_out, block_ref_env.root)
     assert out.strip() == "[[Foo#^abc123]]"
 
 
 @pytest.mark.req("REQ-BLOCKREF-002")
-def test_unresolved_block_refs_are_left_unchanged(tmp_path):
+def test_unresolved_block_refs_are_left_unchanged(block_ref_env):
     text = "Ref ((unknownid)) end\n"
-    index = {}
-    in_to_out = {}
-    out = l2o.replace_block_refs(text, index, in_to_out, tmp_path)
+    out = replace_block_refs(text, {}, {}, block_ref_env.root)
     assert out == text
 
 
 @pytest.mark.req("REQ-PROPS-001")
 def test_collapsed_property_is_filtered_on_block_level():
     src = "title:: X\n\n- Item 1\n  collapsed:: true\n- Item 2\n"
-    out = l2o.transform_markdown(src)
+    out = transform_markdown(src)
     # Block-level collapsed line removed
     assert "collapsed::" not in out
 
 
 @pytest.mark.req("REQ-EMBED-001")
 @pytest.mark.req("REQ-LINKPATH-001")
-def test_embed_block_ref_converts_to_obsidian_embed(tmp_path):
+def test_embed_block_ref_converts_to_obsidian_embed(block_ref_env):
     text = "{{embed ((abc123))}}\n"
-    src = Path(tmp_path / "pages/Foo.md")
-    dst = Path(tmp_path / "Foo.md")
-    index = {"abc123": src}
-    in_to_out = {src: dst}
-    replaced = l2o.replace_block_refs(text, index, in_to_out, tmp_path)
-    embedded = l2o.replace_embeds(replaced)
+    replaced = replace_block_refs(text, block_ref_env.index, block_ref_env.in_to_out, block_ref_env.root)
+    embedded = replace_embeds(replaced)
     assert embedded.strip() == "![[Foo#^abc123]]"
 
 
 @pytest.mark.req("REQ-EMBED-002")
 def test_embed_page_link_converts_to_obsidian_embed():
     text = "{{embed [[Foo]]}}\n"
-    embedded = l2o.replace_embeds(text)
+    embedded = replace_embeds(text)
     assert embedded.strip() == "![[Foo]]"
 
 
@@ -342,14 +404,14 @@ def test_video_and_youtube_macros_convert_to_markdown_embeds():
     video = "{{video https://www.youtube.com/watch?v=Aq5WXmQQooo}}\n"
     youtube = "{{youtube https://www.youtube.com/watch?v=Aq5WXmQQooo}}\n"
 
-    assert l2o.replace_embeds(video).strip() == "![](https://www.youtube.com/watch?v=Aq5WXmQQooo)"
-    assert l2o.replace_embeds(youtube).strip() == "![](https://www.youtube.com/watch?v=Aq5WXmQQooo)"
+    assert replace_embeds(video).strip() == "![](https://www.youtube.com/watch?v=Aq5WXmQQooo)"
+    assert replace_embeds(youtube).strip() == "![](https://www.youtube.com/watch?v=Aq5WXmQQooo)"
 
 
 @pytest.mark.req("REQ-LINKALIAS-001")
 def test_markdown_alias_links_convert_to_obsidian_alias():
     text = "Before [Display Name]([[Page Name]]) after [Docs](https://example.com)\n"
-    out = l2o.replace_page_alias_links(text)
+    out = replace_page_alias_links(text)
     assert "[[Page Name|Display Name]]" in out
     assert "[Docs](https://example.com)" in out
 
@@ -357,7 +419,7 @@ def test_markdown_alias_links_convert_to_obsidian_alias():
 @pytest.mark.req("REQ-LINKALIAS-001")
 def test_alias_links_inside_code_fence_are_ignored():
     text = "```\n[Display Name]([[Page Name]])\n```\n"
-    out = l2o.replace_page_alias_links(text)
+    out = replace_page_alias_links(text)
     assert out == text
 
 
@@ -365,39 +427,39 @@ def test_alias_links_inside_code_fence_are_ignored():
 def test_markdown_image_in_assets_converts_to_obsidian_embed(tmp_path):
     # paths relative to physical file location in Logseq pages
     text = "![alt](../assets/picture.png)\n"
-    out = l2o.replace_asset_images(text)
+    out = replace_asset_images(text)
     assert out.strip() == "![[picture.png]]"
     # Also support assets/picture.png form
     text2 = "![x](assets/picture.png)\n"
-    out2 = l2o.replace_asset_images(text2)
+    out2 = replace_asset_images(text2)
     assert out2.strip() == "![[picture.png]]"
 
 
 @pytest.mark.req("REQ-IMAGE-001")
 def test_image_replacement_keeps_following_newline():
     text = "- ![alt](../assets/picture.png)\n- Next line\n"
-    out = l2o.replace_asset_images(text)
+    out = replace_asset_images(text)
     assert out == "- ![[picture.png]]\n- Next line\n"
 
 
 @pytest.mark.req("REQ-IMAGE-001")
 def test_image_replacement_keeps_following_text():
     text = "- ![alt](../assets/picture.png) - Same line\n"
-    out = l2o.replace_asset_images(text)
+    out = replace_asset_images(text)
     assert out == "- ![[picture.png]] - Same line\n"
 
 
 @pytest.mark.req("REQ-IMAGE-002")
 def test_markdown_image_with_size_attrs_converts_to_size_suffix():
     text = "![alt](../assets/picture.png){:height 424, :width 675}"
-    out = l2o.replace_asset_images(text)
+    out = replace_asset_images(text)
     assert out.strip() == "![[picture.png|675x424]]"
 
 
 @pytest.mark.req("REQ-FRONTMATTER-005")
 def test_only_leading_properties_become_yaml_frontmatter():
     src = "title:: A\n\nBody\n\ntitle:: B\n"
-    out = l2o.transform_markdown(src)
+    out = transform_markdown(src)
     # Expect YAML front matter with title: A only
     assert out.startswith("---\n")
     parts = out.split("---\n")
@@ -412,7 +474,7 @@ def test_only_leading_properties_become_yaml_frontmatter():
 @pytest.mark.req("REQ-TITLE-001")
 def test_title_equal_to_output_path_is_suppressed():
     src = "title:: folder/note\n\nBody\n"
-    out = l2o.transform_markdown(src, expected_title_path="folder/note")
+    out = transform_markdown(src, expected_title_path="folder/note")
     # No front matter should be present when the only property (title) is dropped
     assert not out.startswith("---\n")
     # And no title appears anywhere
@@ -420,9 +482,10 @@ def test_title_equal_to_output_path_is_suppressed():
 
 
 @pytest.mark.req("REQ-TITLE-001")
-def test_title_mismatch_warns_and_title_dropped(capsys):
+def test_title_mismatch_warns_and_title_dropped(caplog):
+    caplog.set_level(logging.WARNING, logger="logseq_to_obsidian")
     src = "title:: Display Name\n\nBody\n"
-    out = l2o.transform_markdown(
+    out = transform_markdown(
         src,
         expected_title_path="folder/note",
         rel_path_for_warn=Path("pages/note.md"),
@@ -431,8 +494,7 @@ def test_title_mismatch_warns_and_title_dropped(capsys):
     assert "title:" not in out
     assert "aliases:" not in out or "Display Name" not in out
     # Warning emitted
-    captured = capsys.readouterr()
-    assert "Title property mismatch" in captured.out
+    assert any("Title property mismatch" in r.message for r in caplog.records)
 
 
 @pytest.mark.req("REQ-HEADCHILD-001")
@@ -440,7 +502,7 @@ def test_title_mismatch_warns_and_title_dropped(capsys):
 @pytest.mark.req("REQ-HEADCHILD-003")
 def test_heading_followed_by_indented_list_becomes_list_heading():
     src = "# Heading without '-' at the beginning\n\t- list item 1\n\t- list item 2\n"
-    out = l2o.transform_markdown(src)
+    out = transform_markdown(src)
     lines = out.splitlines()
     assert lines[0].startswith("- # Heading without '-'")
     assert lines[1] == "\t- list item 1"
@@ -450,7 +512,7 @@ def test_heading_followed_by_indented_list_becomes_list_heading():
 @pytest.mark.req("REQ-HEADCHILD-001")
 def test_heading_followed_by_tab_indented_list_becomes_list_heading():
     src = "# Heading with tabs\n\t- item A\n\t\t- item B\n"
-    out = l2o.transform_markdown(src)
+    out = transform_markdown(src)
     lines = out.splitlines()
     assert lines[0].startswith("- # Heading with tabs")
     # Child lines remain with tabs; we only prefix the heading
@@ -458,16 +520,34 @@ def test_heading_followed_by_tab_indented_list_becomes_list_heading():
     assert lines[2].startswith("\t\t- item B")
 
 
+@pytest.mark.req("REQ-HEADCHILD-001")
+def test_heading_followed_by_non_ascii_numbered_list_becomes_list_heading():
+    # Ordered-list digits are classified with str.isdigit, the same as for fences
+    src = "# Heading\n    ١. item\n"
+    assert transform_markdown(src) == "- # Heading\n    ١. item\n"
+
+
 @pytest.mark.req("REQ-HEADCHILD-002")
 def test_heading_already_inside_list_is_unchanged():
     src = "- # Already a list heading\n\t- child\n"
-    out = l2o.transform_markdown(src)
+    out = transform_markdown(src)
     assert out.startswith("- # Already a list heading")
 
 
 @pytest.mark.req("REQ-HEADCHILD-003")
 def test_no_change_inside_code_fence():
     src = "```\n# Not a real heading\n\t- list item\n```\n"
-    out = l2o.transform_markdown(src)
+    out = transform_markdown(src)
     # Fenced block should remain untouched
     assert out == src
+
+
+@pytest.mark.req("REQ-TITLE-001")
+def test_title_mismatch_warns_for_every_identical_page():
+    src = "title:: Display Name\n\n- TODO Body\n"
+    warnings = []
+    first = transform_markdown(src, expected_title_path="a", warn_collector=warnings)
+    second = transform_markdown(src, expected_title_path="b", warn_collector=warnings)
+    # Identical pages convert identically, but each one still reports its own mismatch
+    assert first == second == "- [ ] Body\n"
+    assert len(warnings) == 2